@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
-import argparse
+import sys
+
+_RESULTS_BANNER = "===== Poker CLI Results ====="
+
+# Per-out improvement rate, keyed by cards left to see (defaults to 4%)
+_RULE_OF_2_AND_4_RATE = {1: 0.02, 2: 0.04}
+
 
 def rule_of_2_and_4(outs: int, cards_left_to_see: int) -> float:
-    if cards_left_to_see == 2:
-        return min(1.0, outs * 0.04)  # 4% per out
-    elif cards_left_to_see == 1:
-        return min(1.0, outs * 0.02)  # 2% per out
-    else:
-        return min(1.0, outs * 0.04)
+    return min(1.0, outs * _RULE_OF_2_AND_4_RATE.get(cards_left_to_see, 0.04))
 
 
-def exact_probability_by_outs(outs: int, cards_left_to_see: int, visible_cards: int = 5) -> float:
+def _compute_exact_probability(outs: int, cards_left_to_see: int, visible_cards: int) -> float:
     deck_size = 52 - visible_cards  # naive approach
     
     p_no_out = 1.0
@@ -20,11 +21,126 @@ def exact_probability_by_outs(outs: int, cards_left_to_see: int, visible_cards:
     return 1.0 - p_no_out
 
 
+# Every realistic (outs, cards_left_to_see, visible_cards) combination, built once at import
+_EXACT_TABLE = {
+    (o, c, v): _compute_exact_probability(o, c, v)
+    for o in range(23)
+    for c in (1, 2)
+    for v in range(2, 8)
+}
+
+
+def exact_probability_by_outs(outs: int, cards_left_to_see: int, visible_cards: int = 5) -> float:
+    probability = _EXACT_TABLE.get((outs, cards_left_to_see, visible_cards))
+    if probability is None:
+        probability = _compute_exact_probability(outs, cards_left_to_see, visible_cards)
+    return probability
+
+
+def _python_batch(outs, cards_left_to_see, visible_cards, out):
+    for i in range(len(outs)):
+        out[i] = exact_probability_by_outs(int(outs[i]), int(cards_left_to_see[i]), int(visible_cards[i]))
+    return out
+
+
+def _ndarray_batch(np, kernel):
+    # Give every NumPy-backed kernel int64 inputs and a float64 output, whatever the caller passed
+    def batch(outs, cards_left_to_see, visible_cards, out):
+        outs = np.asarray(outs).astype(np.int64)
+        cards_left_to_see = np.asarray(cards_left_to_see).astype(np.int64)
+        visible_cards = np.asarray(visible_cards).astype(np.int64)
+        if isinstance(out, np.ndarray) and out.dtype == np.float64 and out.shape == outs.shape:
+            return kernel(outs, cards_left_to_see, visible_cards, out)
+        result = kernel(outs, cards_left_to_see, visible_cards, np.empty(outs.shape, dtype=np.float64))
+        out[:] = result.tolist()
+        return out
+
+    return batch
+
+
+def _load_off_grid_kernel(np):
+    # Inputs outside the float32 grid are computed exactly, JIT-compiled when numba is installed
+    try:
+        from numba import njit, prange
+    except ImportError:
+        njit = None
+
+    if njit is not None:
+        exact_kernel = njit(cache=True)(_compute_exact_probability)
+
+        @njit(parallel=True, cache=True)
+        def numba_batch(outs, cards_left_to_see, visible_cards, out):
+            for i in prange(outs.shape[0]):
+                out[i] = exact_kernel(outs[i], cards_left_to_see[i], visible_cards[i])
+            return out
+
+        return numba_batch
+
+    def python_kernel(outs, cards_left_to_see, visible_cards, out):
+        for i in range(outs.shape[0]):
+            out[i] = _compute_exact_probability(int(outs[i]), int(cards_left_to_see[i]), int(visible_cards[i]))
+        return out
+
+    return python_kernel
+
+
+def _load_batch_backend():
+    # numba/numpy are optional and slow to import, so only pay for them on the first batch call
+    try:
+        import numpy as np
+    except ImportError:
+        return _python_batch
+
+    # Outs 0-22 x cards left 0-2 x visible cards 0-7, indexed directly by the inputs
+    grid = np.empty((23, 3, 8), dtype=np.float32)
+    for o in range(23):
+        for c in range(3):
+            for v in range(8):
+                grid[o, c, v] = _compute_exact_probability(o, c, v)
+
+    off_grid_kernel = None
+
+    def grid_batch(outs, cards_left_to_see, visible_cards, out):
+        nonlocal off_grid_kernel
+        # Bounds-checked so negative indices do not wrap around
+        in_grid = ((outs >= 0) & (outs < grid.shape[0])
+                   & (cards_left_to_see >= 0) & (cards_left_to_see < grid.shape[1])
+                   & (visible_cards >= 0) & (visible_cards < grid.shape[2]))
+        out[in_grid] = grid[outs[in_grid], cards_left_to_see[in_grid], visible_cards[in_grid]]
+        if not in_grid.all():
+            if off_grid_kernel is None:
+                off_grid_kernel = _load_off_grid_kernel(np)
+            off_grid = ~in_grid
+            out[off_grid] = off_grid_kernel(outs[off_grid], cards_left_to_see[off_grid], visible_cards[off_grid],
+                                            np.empty(int(off_grid.sum()), dtype=np.float64))
+        return out
+
+    return _ndarray_batch(np, grid_batch)
+
+
+_batch_backend = None
+
+
+def exact_probability_by_outs_batch(outs, cards_left_to_see, visible_cards, out):
+    # outs, cards_left_to_see and visible_cards are equal-length sequences (lists or ndarrays) of
+    # integer counts; out is a mutable sequence of the same length, filled in place and returned.
+    # Every backend accepts the same inputs. Results are accurate to float32 precision (about 7
+    # significant digits): with NumPy installed, in-grid inputs (outs 0-22, cards left 0-2, visible
+    # cards 0-7) are read from a float32 table and the rest are computed in float64, JIT-compiled by
+    # numba when available; without NumPy everything is computed in float64.
+    global _batch_backend
+    if _batch_backend is None:
+        _batch_backend = _load_batch_backend()
+    return _batch_backend(outs, cards_left_to_see, visible_cards, out)
+
+
 def pot_odds(pot_size: float, call_amount: float) -> float:
     return (pot_size + call_amount) / call_amount
 
 
 def main():
+    import argparse  # only needed when run as a CLI
+
     parser = argparse.ArgumentParser(
         description="Poker CLI: Calculate outs-based hand probabilities and compare to pot odds."
     )
@@ -90,25 +206,34 @@ def main():
     else:
         final_pot_odds = 0.0
 
-    # Display results
-    print("===== Poker CLI Results =====")
-    print(f"Outs: {args.outs}")
-    print(f"Cards left to see: {args.cards_left_to_see}")
-    print(f"Method: {args.method}")
-    print(f"Win Probability: {win_probability:.2%}")
-    print(f"Odds Against (Your hand): {odds_against:.2f}:1")
+    # Display results, written in one go
+    lines = [
+        _RESULTS_BANNER,
+        f"Outs: {args.outs}",
+        f"Cards left to see: {args.cards_left_to_see}",
+        f"Method: {args.method}",
+        f"Win Probability: {win_probability:.2%}",
+        f"Odds Against (Your hand): {odds_against:.2f}:1",
+    ]
 
     if args.call_amount > 0:
-        print(f"Pot Size: {args.pot_size}")
-        print(f"Call Amount: {args.call_amount}")
-        print(f"Pot Odds: {final_pot_odds:.2f}:1")
-
-        if final_pot_odds >= odds_against:
-            print("=> Pot odds are favorable compared to your odds of hitting (profitable call).")
+        lines.append(f"Pot Size: {args.pot_size}")
+        lines.append(f"Call Amount: {args.call_amount}")
+        lines.append(f"Pot Odds: {final_pot_odds:.2f}:1")
+
+        # (P + C) / C >= (1 - p) / p, cross-multiplied to avoid the divisions
+        profitable = (
+            (args.pot_size + args.call_amount) * win_probability
+            >= args.call_amount * (1.0 - win_probability)
+        )
+        if profitable:
+            lines.append("=> Pot odds are favorable compared to your odds of hitting (profitable call).")
         else:
-            print("=> Pot odds are NOT favorable compared to your odds of hitting (fold might be better).")
+            lines.append("=> Pot odds are NOT favorable compared to your odds of hitting (fold might be better).")
     else:
-        print("No call amount specified, skipping pot odds comparison.")
+        lines.append("No call amount specified, skipping pot odds comparison.")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
-import argparse
+import atexit
+import csv
 import re
-import datetime
 import sys
+from functools import lru_cache
 
 RANGES = {
     # Under the Gun (tightest)
@@ -95,113 +96,208 @@ RANGES = {
     },
 }
 
+# Ranges are read-only: freeze them, sharing one object between positions with identical sets (co/sb call)
+_SHARED_RANGES = {}
+for _pos_ranges in RANGES.values():
+    for _kind, _hands in _pos_ranges.items():
+        _pos_ranges[_kind] = _SHARED_RANGES.setdefault(frozenset(_hands), frozenset(_hands))
 
-def normalize_hand(hole_cards: str) -> str:
-    import re
-    pattern = re.findall(r'([AKQJT2-9][hcds])', hole_cards, re.IGNORECASE)
-    if len(pattern) < 2:
-        # fallback: try splitting
-        pattern = hole_cards.split()
+
+_CARD_RE = re.compile(r'[AKQJT2-9][hcds]', re.IGNORECASE | re.ASCII)
+_RANKS = "23456789TJQKA"
+_SUITS = "hcdsHCDS"
+
+# Rank value (2..14) indexed by ord() of either case of the rank character; 0 means not a rank
+_RANK = bytearray(128)
+for _value, _r in enumerate(_RANKS, 2):
+    _RANK[ord(_r)] = _RANK[ord(_r.lower())] = _value
+
+
+@lru_cache(maxsize=1024)
+def normalize_hand(hole_cards: str) -> int:
+    # Fast path for the common 'AhKc' / 'Ah Kc' input: read fixed offsets, no regex
+    compact = hole_cards.replace(" ", "")
+    if (len(compact) == 4 and compact.isascii()
+            and _RANK[ord(compact[0])] and compact[1] in _SUITS
+            and _RANK[ord(compact[2])] and compact[3] in _SUITS):
+        pattern = [compact[:2], compact[2:]]
+    else:
+        pattern = _CARD_RE.findall(hole_cards)
+        if len(pattern) < 2:
+            # fallback: try splitting
+            pattern = hole_cards.split()
 
     if len(pattern) != 2:
         return None
 
     card1, card2 = pattern[0], pattern[1]
-    rank_order = {'A': 14, 'K': 13, 'Q': 12, 'J': 11, 'T': 10,
-                  '9': 9, '8': 8, '7': 7, '6': 6, '5': 5, '4': 4, '3': 3, '2': 2}
+    if not (len(card1) == 2 and len(card2) == 2 and card1.isascii() and card2.isascii()):
+        return None  # _RANK only covers ASCII
 
     # Separate rank and suit
-    r1, s1 = card1[0].upper(), card1[1].lower()
-    r2, s2 = card2[0].upper(), card2[1].lower()
+    r1, s1 = _RANK[ord(card1[0])], card1[1].lower()
+    r2, s2 = _RANK[ord(card2[0])], card2[1].lower()
+    if not r1 or not r2:
+        return None
 
     # Sort so highest rank is first
-    if rank_order[r2] > rank_order[r1]:
+    if r2 > r1:
         r1, r2 = r2, r1
         s1, s2 = s2, s1
 
-    # If same suit and same rank => e.g. 'AA'
-    if r1 == r2:
-        return r1 + r2  # 'AA', 'KK', etc.
+    # Pairs are never suited; otherwise check suited or offsuit
+    return _hand_key(r1, r2, r1 != r2 and s1 == s2)
+
+
+def _hand_key(r1: int, r2: int, suited: bool) -> int:
+    return (r1 << 8) | (r2 << 4) | (1 if suited else 0)
+
+
+def _parse_hand(hand: str) -> int:
+    # 'AKs' / 'AKo' / 'AA' range notation -> hand key
+    return _hand_key(_RANK[ord(hand[0])], _RANK[ord(hand[1])], hand[2:] == "s")
 
-    # Check suited or offsuit
-    if s1 == s2:
-        return f"{r1}{r2}s"
-    else:
-        return f"{r1}{r2}o"
+
+# Hand key -> 'AA', 'AKs', 'AKo', ... for display and logging
+_HAND_STR = {}
+for _v1, _r1 in enumerate(_RANKS, 2):
+    for _v2, _r2 in enumerate(_RANKS[:_v1 - 1], 2):
+        if _r1 == _r2:
+            _HAND_STR[_hand_key(_v1, _v2, False)] = _r1 + _r2
+        else:
+            _HAND_STR[_hand_key(_v1, _v2, True)] = f"{_r1}{_r2}s"
+            _HAND_STR[_hand_key(_v1, _v2, False)] = f"{_r1}{_r2}o"
+
+
+# Flat (position, hand) -> range lookup; hands in neither range are folds
+_ACTION = {}
+for _pos, _pos_ranges in RANGES.items():
+    for _hand in _pos_ranges["call"]:
+        _ACTION[(_pos, _parse_hand(_hand))] = "call"
+    for _hand in _pos_ranges["raise"]:
+        _ACTION[(_pos, _parse_hand(_hand))] = "raise"
+
+# Only these raise-range hands continue against a 3-bet
+_FOUR_BET_HANDS = frozenset(_parse_hand(h) for h in ("AA", "KK", "QQ", "AKs", "AKo"))
+
+# Interned suggestion strings, shared by every decision returned below
+_SUGG = {s: sys.intern(s) for s in ("raise", "call", "fold", "3-bet", "4-bet", "all-in")}
+_RAISE_LIKE = frozenset((_SUGG["raise"], _SUGG["3-bet"], _SUGG["4-bet"]))
+
+# Short-stacked play is push or fold, regardless of prior action
+_SHORT_STACK_DECISIONS = {
+    "raise": (_SUGG["all-in"], "Short-stacked strategy: Push with premium/strong range."),
+    "call": (_SUGG["fold"], "Short-stacked strategy: Hand not strong enough to shove."),
+    "fold": (_SUGG["fold"], "Short-stacked strategy: Hand not strong enough to shove."),
+}
+
+# (action_before, range) -> (suggestion, explanation)
+_DECISIONS = {
+    # We are first to act (open)
+    ("none", "raise"): (_SUGG["raise"], "Open-raise with a strong or premium hand."),
+    ("none", "call"): (_SUGG["call"], "You might limp/call with a speculative hand if table conditions allow."),
+    ("none", "fold"): (_SUGG["fold"], "Not in raise/call range for your position. Fold."),
+    # Someone else has raised already: 3-bet or flat with speculative hands
+    ("raise", "raise"): (_SUGG["3-bet"], "Facing a raise: 3-bet with your strong range."),
+    ("raise", "call"): (_SUGG["call"], "Facing a raise: Flat-call with your speculative hand."),
+    ("raise", "fold"): (_SUGG["fold"], "Facing a raise: Hand not strong enough. Fold."),
+    # There's a caller ahead, but no raise
+    ("call", "raise"): (_SUGG["raise"], "Isolate the limper with a strong hand."),
+    ("call", "call"): (_SUGG["call"], "Over-limp with a speculative hand."),
+    ("call", "fold"): (_SUGG["fold"], "Not strong enough to raise or call. Fold."),
+    # There's already a 3-bet, so only top range
+    ("3bet", "raise"): (_SUGG["4-bet"], "Facing a 3-bet: 4-bet only top-tier hands."),
+    ("3bet", "call"): (_SUGG["fold"], "Facing a 3-bet: This hand is not strong enough."),
+    ("3bet", "fold"): (_SUGG["fold"], "Facing a 3-bet: This hand is not strong enough."),
+}
 
 
-def get_preflop_suggestion(hand: str, position: str, stack_size: float, action_before: str) -> (str, str):
+def _compute_preflop_suggestion(hand: int, position: str, stack_size: float, action_before: str) -> (str, str):
     if position not in RANGES:
-        return ("fold", f"Position {position} not recognized in RANGES.")
+        return (_SUGG["fold"], f"Position {position} not recognized in RANGES.")
 
-    pos_ranges = RANGES[position]
-    is_in_raise_range = (hand in pos_ranges["raise"])
-    is_in_call_range = (hand in pos_ranges["call"])
+    act = _ACTION.get((position, hand), "fold")
 
     # Check stack size
     if stack_size < 20:
-        # Simplified "push or fold" range if short-stacked
-        if is_in_raise_range:
-            return ("all-in", "Short-stacked strategy: Push with premium/strong range.")
-        else:
-            return ("fold", "Short-stacked strategy: Hand not strong enough to shove.")
+        return _SHORT_STACK_DECISIONS[act]
+
+    if action_before == "3bet" and hand not in _FOUR_BET_HANDS:
+        act = "fold"
+
+    decision = _DECISIONS.get((action_before, act))
+    if decision is None:
+        return (_SUGG["fold"], f"Unknown action_before={action_before}; defaulting to fold.")
+    return decision
+
+
+# Short-stacked (position, hand) decisions; push or fold does not depend on prior action
+_SHORT_STACK_SUGGESTIONS = {
+    (position, hand): _SHORT_STACK_DECISIONS[_ACTION.get((position, hand), "fold")]
+    for position in RANGES
+    for hand in _HAND_STR
+}
+
+# Every (position, hand, action_before) outcome for normal stacks, resolved once at import.
+# Values are the shared tuples from the decision tables above, so no strings are duplicated.
+_PREFLOP_SUGGESTIONS = {
+    (position, hand, action_before): _compute_preflop_suggestion(hand, position, 100.0, action_before)
+    for position in RANGES
+    for hand in _HAND_STR
+    for action_before in ("none", "raise", "call", "3bet")
+}
+
+
+def get_preflop_suggestion(hand: int, position: str, stack_size: float, action_before: str) -> (str, str):
+    if not isinstance(hand, int):
+        raise TypeError(f"hand must be a key from normalize_hand(), not {hand!r}")
+    if stack_size < 20:
+        decision = _SHORT_STACK_SUGGESTIONS.get((position, hand))
     else:
-        # If there's prior action
-        if action_before == "none":
-            # We are first to act (open)
-            if is_in_raise_range:
-                return ("raise", "Open-raise with a strong or premium hand.")
-            elif is_in_call_range:
-                return ("call", "You might limp/call with a speculative hand if table conditions allow.")
-            else:
-                return ("fold", "Not in raise/call range for your position. Fold.")
-        elif action_before == "raise":
-            # Someone else has raised already
-            # Typically we 3-bet or fold, but let's say we call with certain pockets/suited connectors
-            if is_in_raise_range:
-                return ("3-bet", "Facing a raise: 3-bet with your strong range.")
-            elif is_in_call_range:
-                return ("call", "Facing a raise: Flat-call with your speculative hand.")
-            else:
-                return ("fold", "Facing a raise: Hand not strong enough. Fold.")
-        elif action_before == "call":
-            # There's a caller ahead, but no raise
-            if is_in_raise_range:
-                return ("raise", "Isolate the limper with a strong hand.")
-            elif is_in_call_range:
-                return ("call", "Over-limp with a speculative hand.")
-            else:
-                return ("fold", "Not strong enough to raise or call. Fold.")
-        elif action_before == "3bet":
-            # There's already a 3-bet, so only top range
-            if is_in_raise_range and hand in {"AA", "KK", "QQ", "AKs", "AKo"}:
-                return ("4-bet", "Facing a 3-bet: 4-bet only top-tier hands.")
-            else:
-                return ("fold", "Facing a 3-bet: This hand is not strong enough.")
-        else:
-            return ("fold", f"Unknown action_before={action_before}; defaulting to fold.")
+        decision = _PREFLOP_SUGGESTIONS.get((position, hand, action_before))
+    if decision is None:
+        # Unknown position or action: build the error explanation
+        return _compute_preflop_suggestion(hand, position, stack_size, action_before)
+    return decision
+
+
+# Open-raise size in BB by position
+_RAISE_SIZE = {"utg": 3.0, "mp": 3.0, "hj": 3.0, "co": 2.5, "btn": 2.2, "sb": 3.0, "bb": 3.0}
 
 
 def get_recommended_raise_size(position: str, stack_size: float) -> float:
-    if position in ["utg", "mp", "hj"]:
-        return 3.0
-    elif position == "co":
-        return 2.5
-    elif position == "btn":
-        return 2.2
-    elif position == "sb":
-        return 3.0
-    elif position == "bb":
-        return 3.0
-    else:
-        return 2.5  # fallback
+    return _RAISE_SIZE.get(position, 2.5)  # 2.5 fallback
+
+
+# filename -> (append handle, csv writer); handles stay open for the life of the process
+# and are flushed and closed at exit
+_LOG_WRITERS = {}
 
 
-def log_decision(cards: str, normalized: str, position: str, stack_size: float, action_before: str,
+def _get_log_writer(filename: str):
+    entry = _LOG_WRITERS.get(filename)
+    if entry is None:
+        f = open(filename, "a", newline="", buffering=1 << 16)
+        atexit.register(f.close)
+        entry = _LOG_WRITERS[filename] = (f, csv.writer(f, lineterminator="\n"))
+    return entry[1]
+
+
+def log_decision(cards: str, normalized: int, position: str, stack_size: float, action_before: str,
                  suggestion: str, explanation: str, filename="preflop_suggestions.csv"):
+    if not isinstance(normalized, int):
+        raise TypeError(f"normalized must be a key from normalize_hand(), not {normalized!r}")
+    import datetime  # only paid for when a decision is actually logged
+
     timestamp = datetime.datetime.now().isoformat()
-    with open(filename, "a") as f:
-        f.write(f"{timestamp},{cards},{normalized},{position},{stack_size},{action_before},{suggestion},{explanation}\n")
+    _get_log_writer(filename).writerow(
+        (timestamp, cards, _HAND_STR[normalized], position, stack_size, action_before, suggestion, explanation)
+    )
+
+
+_DECISION_BANNER = "\n=== Decision ==="
+_ADVISOR_BANNER = "=== Enhanced Pre-Flop Advisor ==="
+
 
 def run_interactive():
     print("=== Interactive Pre-Flop Advisor ===")
@@ -217,7 +313,7 @@ def run_interactive():
         stack_size = 100.0
 
     normalized = normalize_hand(cards)
-    if not normalized:
+    if normalized is None:
         print("Error parsing hole cards. Exiting.")
         return
 
@@ -225,20 +321,31 @@ def run_interactive():
     suggestion, explanation = get_preflop_suggestion(normalized, position, stack_size, action_before)
 
     # Display recommendation
-    print("\n=== Decision ===")
-    print(f"Your hand: {cards} -> Normalized: {normalized}")
-    print(f"Position: {position.upper()} | Stack: {stack_size}BB | Prior Action: {action_before}")
-    print(f"Suggested Action: {suggestion.upper()}")
-    if suggestion in ["raise", "3-bet", "4-bet"]:
+    lines = [
+        _DECISION_BANNER,
+        f"Your hand: {cards} -> Normalized: {_HAND_STR[normalized]}",
+        f"Position: {position.upper()} | Stack: {stack_size}BB | Prior Action: {action_before}",
+        f"Suggested Action: {suggestion.upper()}",
+    ]
+    if suggestion in _RAISE_LIKE:
         r_size = get_recommended_raise_size(position, stack_size)
-        print(f"Recommended Raise Size: ~{r_size:.1f}x BB")
-    print(f"Reason: {explanation}")
+        lines.append(f"Recommended Raise Size: ~{r_size:.1f}x BB")
+    lines.append(f"Reason: {explanation}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Log the decision
     log_decision(cards, normalized, position, stack_size, action_before, suggestion, explanation)
 
 
 def main():
+    # A bare --interactive needs no validation, so skip building the parser; anything
+    # else goes through argparse for help and error handling
+    if sys.argv[1:] == ["--interactive"]:
+        run_interactive()
+        sys.exit(0)
+
+    import argparse  # only needed for the argument-driven flow
+
     parser = argparse.ArgumentParser(
         description="Enhanced Pre-Flop Decision CLI"
     )
@@ -285,7 +392,7 @@ def main():
         sys.exit(1)
 
     normalized = normalize_hand(args.cards)
-    if not normalized:
+    if normalized is None:
         print("Error: Could not parse your hole cards.")
         sys.exit(1)
 
@@ -296,14 +403,17 @@ def main():
         args.action_before
     )
 
-    print("=== Enhanced Pre-Flop Advisor ===")
-    print(f"Hand: {args.cards} -> Normalized: {normalized}")
-    print(f"Position: {args.position.upper()} | Stack: {args.stack_size}BB | Prior Action: {args.action_before}")
-    print(f"Suggested Action: {suggestion.upper()}")
-    if suggestion in ["raise", "3-bet", "4-bet"]:
+    lines = [
+        _ADVISOR_BANNER,
+        f"Hand: {args.cards} -> Normalized: {_HAND_STR[normalized]}",
+        f"Position: {args.position.upper()} | Stack: {args.stack_size}BB | Prior Action: {args.action_before}",
+        f"Suggested Action: {suggestion.upper()}",
+    ]
+    if suggestion in _RAISE_LIKE:
         r_size = get_recommended_raise_size(args.position, args.stack_size)
-        print(f"Recommended Size: ~{r_size:.1f}x BB")
-    print(f"Reason: {explanation}")
+        lines.append(f"Recommended Size: ~{r_size:.1f}x BB")
+    lines.append(f"Reason: {explanation}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     log_decision(args.cards, normalized, args.position, args.stack_size,
                  args.action_before, suggestion, explanation)
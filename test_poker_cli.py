@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+import poker_cli
+
+
+def test_exact_probability_by_outs_matches_direct_computation():
+    for outs in (0, 4, 9, 15, 30):
+        for cards_left_to_see in (1, 2):
+            assert poker_cli.exact_probability_by_outs(outs, cards_left_to_see) == pytest.approx(
+                poker_cli._compute_exact_probability(outs, cards_left_to_see, 5)
+            )
+
+
+@pytest.fixture(params=["python", "numpy", "numba"])
+def batch_backend(request, monkeypatch):
+    # Hide the optional packages a backend must not see, then let the public function pick.
+    # "numpy" serves off-grid inputs in plain Python, "numba" serves them with the JIT kernel.
+    if request.param == "python":
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    else:
+        pytest.importorskip("numpy")
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.setattr(poker_cli, "_batch_backend", None)
+    return request.param
+
+
+@pytest.mark.parametrize("as_float", [False, True])
+def test_batch_accepts_the_same_arguments_on_every_backend(batch_backend, as_float):
+    cases = [(9, 2, 5), (4, 1, 6), (0, 2, 5), (22, 1, 7), (-1, 2, 5), (30, 2, 5), (9, 2, 9)]
+    outs, cards_left_to_see, visible_cards = ([float(x) if as_float else x for x in col] for col in zip(*cases))
+    out = [0.0] * len(cases)
+    result = poker_cli.exact_probability_by_outs_batch(outs, cards_left_to_see, visible_cards, out)
+    assert result is out
+    assert out == pytest.approx([poker_cli._compute_exact_probability(*case) for case in cases], rel=1e-6)
+
+
+def test_batch_fills_ndarray_out(batch_backend):
+    if batch_backend == "python":
+        pytest.skip("numpy is hidden")
+    import numpy as np
+
+    out = np.zeros(2)
+    result = poker_cli.exact_probability_by_outs_batch(np.array([9, 4]), np.array([2, 1]), np.array([5, 6]), out)
+    assert result is out
+    assert out.tolist() == pytest.approx([poker_cli._compute_exact_probability(9, 2, 5),
+                                          poker_cli._compute_exact_probability(4, 1, 6)], rel=1e-6)
@@ -0,0 +1,81 @@
+import csv
+import datetime
+
+import pytest
+
+import preflop
+
+
+def test_normalize_hand():
+    assert preflop._HAND_STR[preflop.normalize_hand("Ah Kc")] == "AKo"
+    assert preflop._HAND_STR[preflop.normalize_hand("9s Ts")] == "T9s"
+    assert preflop._HAND_STR[preflop.normalize_hand("8s 8c")] == "88"
+
+
+def test_normalize_hand_rejects_unknown_ranks():
+    assert preflop.normalize_hand("Ah Xx") is None
+    assert preflop.normalize_hand("A K") is None
+    assert preflop.normalize_hand("Äh Kc") is None
+    assert preflop.normalize_hand("Ah \u212ac") is None  # KELVIN SIGN is not a K
+
+
+def test_hand_strings_are_rejected():
+    with pytest.raises(TypeError):
+        preflop.get_preflop_suggestion("AKs", "co", 100, "none")
+    with pytest.raises(TypeError):
+        preflop.log_decision("Ah Kh", "AKs", "co", 100, "none", "raise", "")
+
+
+_ACTIONS = ("none", "raise", "call", "3bet", "limp")
+
+
+@pytest.mark.parametrize("stack_size", [10, 19.99, 20, 100])
+def test_suggestion_tables_match_direct_computation(stack_size):
+    for position in list(preflop.RANGES) + ["utg+1"]:
+        for hand in preflop._HAND_STR:
+            for action_before in _ACTIONS:
+                assert preflop.get_preflop_suggestion(hand, position, stack_size, action_before) == \
+                    preflop._compute_preflop_suggestion(hand, position, stack_size, action_before)
+
+
+def test_facing_3bet_only_continues_with_four_bet_hands():
+    for hand in ("AA", "KK", "QQ", "AKs", "AKo"):
+        assert preflop.get_preflop_suggestion(preflop._parse_hand(hand), "utg", 100, "3bet")[0] == "4-bet"
+    # In the raise range, but not a 4-bet hand
+    assert preflop.get_preflop_suggestion(preflop._parse_hand("JJ"), "utg", 100, "3bet") == \
+        ("fold", "Facing a 3-bet: This hand is not strong enough.")
+
+
+def test_short_stack_ignores_unknown_prior_action():
+    assert preflop.get_preflop_suggestion(preflop._parse_hand("AA"), "btn", 10, "limp") == \
+        ("all-in", "Short-stacked strategy: Push with premium/strong range.")
+    assert preflop.get_preflop_suggestion(preflop._parse_hand("72o"), "btn", 10, "limp") == \
+        ("fold", "Short-stacked strategy: Hand not strong enough to shove.")
+    assert preflop.get_preflop_suggestion(preflop._parse_hand("AA"), "btn", 100, "limp") == \
+        ("fold", "Unknown action_before=limp; defaulting to fold.")
+
+
+def test_unknown_position():
+    assert preflop.get_preflop_suggestion(preflop._parse_hand("AA"), "utg+1", 100, "none") == \
+        ("fold", "Position utg+1 not recognized in RANGES.")
+
+
+def test_log_decision_writes_csv_rows(tmp_path):
+    path = tmp_path / "log.csv"
+    hand = preflop.normalize_hand("Ah Kc")
+    preflop.log_decision("Ah, Kc", hand, "btn", 40.0, "none", "raise", "Open-raise, strong hand.", filename=path)
+    preflop.log_decision("Qh Qs", preflop.normalize_hand("Qh Qs"), "utg", 100.0, "raise", "3-bet", "x",
+                         filename=path)
+
+    f, _ = preflop._LOG_WRITERS.pop(path)
+    f.close()
+
+    with open(path, newline="") as log:
+        rows = list(csv.reader(log))
+    assert [row[1:] for row in rows] == [
+        ["Ah, Kc", "AKo", "btn", "40.0", "none", "raise", "Open-raise, strong hand."],
+        ["Qh Qs", "QQ", "utg", "100.0", "raise", "3-bet", "x"],
+    ]
+    for row in rows:
+        datetime.datetime.fromisoformat(row[0])
+    assert '"Ah, Kc"' in path.read_text()